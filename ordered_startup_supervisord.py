@@ -111,6 +111,9 @@ class StartupPlan(object):
 
         self.programs.sort(key=lambda x: x.priority)
 
+        self.program_index = dict((program.name, index) for index, program in enumerate(self.programs))
+        """:type : dict[str, int]"""
+
 
 def main():
     logging.basicConfig(filename='ordered_startup.log', level=logging.DEBUG)
@@ -138,30 +141,32 @@ def main():
             log.info(prog.name)
         if not startup_plan.programs[0].options.autostart:
             rpcinterface.supervisor.startProcess(startup_plan.programs[0].name, False)
+        programs = startup_plan.programs
+        program_index = startup_plan.program_index
+        listener = childutils.listener
         initial_start = 'STARTED'
         while 1:
-            headers, payload = childutils.listener.wait()
-            if headers['eventname'].startswith('PROCESS_STATE') and initial_start != 'FINISHED':
+            headers, payload = listener.wait()
+            eventname = headers['eventname']
+            if initial_start != 'FINISHED' and eventname.startswith('PROCESS_STATE'):
                 pheaders = childutils.get_headers(payload)
-                log.debug("headers = {}".format(repr(headers)))
-                log.debug("payload = {}".format(repr(pheaders)))
-                state = headers['eventname'][len('PROCESS_STATE_'):]
-                start_next = False
-                for program in startup_plan.programs:
-                    if start_next:
-                        log.info("Starting process: {}".format(program.name))
-                        rpcinterface.supervisor.startProcess(program.name)
-                        start_next = False
-                        break
-                    if program.options.startinorder and program.name == pheaders['processname'] and program.options.startnextafter == state:
-                        log.info("Recieved process state of {} from {}, starting next process.".format(state, program.name))
-                        start_next = True
-                else:
-                    if start_next:
-                        log.info("No more processes to start for initial startup, ignoring all future events.")
-                        initial_start = 'FINISHED'
+                log.debug("headers = %r", headers)
+                log.debug("payload = %r", pheaders)
+                state = eventname[len('PROCESS_STATE_'):]
+                index = program_index.get(pheaders['processname'])
+                if index is not None:
+                    program = programs[index]
+                    if program.options.startinorder and program.options.startnextafter == state:
+                        log.info("Recieved process state of %s from %s, starting next process.", state, program.name)
+                        if index + 1 < len(programs):
+                            next_program = programs[index + 1]
+                            log.info("Starting process: %s", next_program.name)
+                            rpcinterface.supervisor.startProcess(next_program.name)
+                        else:
+                            log.info("No more processes to start for initial startup, ignoring all future events.")
+                            initial_start = 'FINISHED'
                 #log.debug("data = {}".format(repr(pdata)))
-            childutils.listener.ok()
+            listener.ok()
     except:
         log.error("ERROR: ", exc_info=sys.exc_info())
 